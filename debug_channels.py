@@ -19,22 +19,27 @@ print("Connected!\n")
 # Stop acquisition
 scope._instrument.write(":STOP")
 
-for channel in [1, 2, 3]:
+channels = [1, 2, 3]
+
+# Query every channel's scale and offset in one compound SCPI message
+# to avoid a bus round-trip per value
+settings_query = ";".join(f":CHAN{ch}:SCALe?;:CHAN{ch}:OFFSet?" for ch in channels)
+settings = scope._instrument.query(settings_query).strip().split(";")
+
+for i, channel in enumerate(channels):
     print(f"=== Channel {channel} ===")
-    
-    # Query channel scale and offset
-    scale = scope._instrument.query(f":CHAN{channel}:SCALe?").strip()
-    offset = scope._instrument.query(f":CHAN{channel}:OFFSet?").strip()
+
+    scale = settings[2 * i].strip()
+    offset = settings[2 * i + 1].strip()
     print(f"  Scale: {scale} V/div")
     print(f"  Offset: {offset} V")
-    
-    # Set waveform source and get preamble
-    scope._instrument.write(f":WAVeform:SOURce CHAN{channel}")
-    scope._instrument.write(":WAVeform:MODE RAW")
-    scope._instrument.write(":WAVeform:FORMat BYTE")
-    scope._instrument.write(":WAVeform:STARt 1")
-    scope._instrument.write(":WAVeform:STOP 1000")
-    
+
+    # Set waveform source and range in a single message, then get preamble
+    scope._instrument.write(
+        f":WAVeform:SOURce CHAN{channel};:WAVeform:MODE RAW;"
+        ":WAVeform:FORMat BYTE;:WAVeform:STARt 1;:WAVeform:STOP 1000"
+    )
+
     preamble_raw = scope._instrument.query(":WAVeform:PREamble?").strip()
     preamble = preamble_raw.split(",")
     y_increment = float(preamble[7])
@@ -1,7 +1,9 @@
 """CLI entry point for ShutterScope."""
 
 import argparse
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -10,11 +12,13 @@ from shutterscope.analysis import (
     measure_pulse_width,
     measure_three_point,
 )
-from shutterscope.oscilloscope import RigolDS1000Z
+from shutterscope.oscilloscope import RigolDS1000Z, WaveformData
 from shutterscope.waveform import (
     save_three_point_json,
+    save_three_point_npy,
     save_three_point_plot,
     save_waveform_json,
+    save_waveform_npy,
     save_waveform_plot,
 )
 
@@ -28,15 +32,17 @@ MAX_CAPTURE_WINDOW = 1.0
 TRIM_MARGIN_FRACTION = 0.1
 # Directory for saving captures
 CAPTURES_DIR = Path("captures")
+# Maximum number of downloaded captures waiting to be analyzed and saved
+CAPTURE_QUEUE_SIZE = 2
 
+# A downloaded capture: output path without suffix and waveforms keyed by channel
+_Capture = tuple[Path, dict[int, WaveformData]]
 
-def _capture_single_point(
-    scope: RigolDS1000Z, args: argparse.Namespace, timestamp: str
-) -> None:
-    """Capture and process single-point measurement."""
-    print("Triggered! Downloading waveform...")
-    waveform = scope.get_waveform(channel=1)
 
+def _process_single_point(
+    waveform: WaveformData, args: argparse.Namespace, base: Path
+) -> None:
+    """Analyze and save a single-point measurement."""
     # Measure shutter speed and trim waveform to pulse region
     try:
         metrics = measure_pulse_width(waveform)
@@ -54,23 +60,25 @@ def _capture_single_point(
         print(f"Warning: Could not measure pulse: {e}")
         metrics = None
 
-    filename = CAPTURES_DIR / f"capture_{timestamp}.json"
-    save_waveform_json(waveform, str(filename), metrics)
-    print(f"Saved {len(waveform.voltages)} samples to {filename}")
+    filename = f"{base}.json"
+    if args.format == "npy":
+        save_waveform_npy(waveform, filename, metrics)
+        samples_file = f"{base}.npy"
+    else:
+        save_waveform_json(waveform, filename, metrics)
+        samples_file = filename
+    print(f"Saved {len(waveform.voltages)} samples to {samples_file}")
 
     if args.plot:
-        plot_filename = CAPTURES_DIR / f"capture_{timestamp}.png"
-        save_waveform_plot(waveform, str(plot_filename))
+        plot_filename = f"{base}.png"
+        save_waveform_plot(waveform, plot_filename)
         print(f"Saved plot to {plot_filename}")
 
 
-def _capture_three_point(
-    scope: RigolDS1000Z, args: argparse.Namespace, timestamp: str
+def _process_three_point(
+    waveforms: dict[int, WaveformData], args: argparse.Namespace, base: Path
 ) -> None:
-    """Capture and process three-point measurement."""
-    print("Triggered! Downloading waveforms...")
-    waveforms = scope.get_waveforms([1, 2, 3])
-
+    """Analyze and save a three-point measurement."""
     try:
         metrics = measure_three_point(waveforms, orientation=args.orientation)
         print(f"\nThree-Point Shutter Measurement ({args.orientation}):")
@@ -116,16 +124,42 @@ def _capture_three_point(
         print(f"Warning: Could not measure pulse: {e}")
         metrics = None
 
-    filename = CAPTURES_DIR / f"capture_{timestamp}.json"
-    save_three_point_json(waveforms, str(filename), metrics)
+    filename = f"{base}.json"
+    if args.format == "npy":
+        save_three_point_npy(waveforms, filename, metrics)
+    else:
+        save_three_point_json(waveforms, filename, metrics)
     print(f"Saved to {filename}")
 
     if args.plot:
-        plot_filename = CAPTURES_DIR / f"capture_{timestamp}.png"
-        save_three_point_plot(waveforms, str(plot_filename))
+        plot_filename = f"{base}.png"
+        save_three_point_plot(waveforms, plot_filename)
         print(f"Saved plot to {plot_filename}")
 
 
+def _process_captures(
+    captures: queue.Queue[_Capture | None], args: argparse.Namespace
+) -> None:
+    """Analyze and save captures from the queue until a None sentinel arrives.
+
+    Runs on a worker thread so the oscilloscope can be re-armed and the next
+    capture downloaded while the previous one is processed.
+    """
+    while (capture := captures.get()) is not None:
+        base, waveforms = capture
+        # Results print once the next trigger is already being waited for, so
+        # each is headed with its capture name
+        print(f"Results for {base.name}:")
+        try:
+            if args.three_point:
+                _process_three_point(waveforms, args, base)
+            else:
+                _process_single_point(waveforms[1], args, base)
+        except Exception as e:
+            print(f"Error: Could not process capture {base.name}: {e}")
+        print()
+
+
 def main() -> None:
     """Main entry point for ShutterScope CLI."""
     parser = argparse.ArgumentParser(
@@ -148,6 +182,13 @@ def main() -> None:
         action="store_true",
         help="Save a plot of the waveform to capture.png",
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "npy"],
+        default="json",
+        help="Capture file format: JSON text, or binary NumPy samples with a "
+        "JSON metadata file (default: json)",
+    )
     parser.add_argument(
         "--three-point",
         action="store_true",
@@ -188,6 +229,16 @@ def main() -> None:
         trigger_channel = 1
         mode_str = "single-channel mode"
 
+    # Downloaded captures are handed to a worker thread for analysis and
+    # saving, so the next trigger can be armed while they are processed. The
+    # worker is a daemon so that a second Ctrl+C while it drains the queue
+    # exits rather than leaving the interpreter waiting on it
+    captures: queue.Queue[_Capture | None] = queue.Queue(maxsize=CAPTURE_QUEUE_SIZE)
+    worker = threading.Thread(
+        target=_process_captures, args=(captures, args), daemon=True
+    )
+    worker.start()
+
     capture_count = 0
     try:
         scope.configure_timebase(
@@ -195,29 +246,40 @@ def main() -> None:
             sample_interval=DEFAULT_SAMPLE_INTERVAL,
             channels=channels,
         )
+        # Trigger settings persist on the oscilloscope, so they are sent once
+        # and each subsequent capture only needs re-arming
+        scope.setup_edge_trigger(channel=trigger_channel, level=args.trigger_level)
         print(f"Configured oscilloscope ({mode_str})")
         print("Press Ctrl+C to exit\n")
 
         while True:
-            scope.setup_edge_trigger(channel=trigger_channel, level=args.trigger_level)
             print("Waiting for trigger...")
 
             scope.wait_for_trigger()
-            timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            # Basic ISO 8601 timestamp, as colons are not valid in Windows filenames
+            base = CAPTURES_DIR / f"capture_{datetime.now():%Y%m%dT%H%M%S}"
 
             if args.three_point:
-                _capture_three_point(scope, args, timestamp)
+                print("Triggered! Downloading waveforms...")
+                waveforms = scope.get_waveforms(channels)
             else:
-                _capture_single_point(scope, args, timestamp)
+                print("Triggered! Downloading waveform...")
+                waveforms = {1: scope.get_waveform(channel=1)}
 
+            scope.arm()
+            captures.put((base, waveforms))
             capture_count += 1
-            print()
 
     except KeyboardInterrupt:
         print(f"\nCaptured {capture_count} waveforms")
     finally:
-        scope.disconnect()
-        print("Disconnected")
+        try:
+            # Let the worker finish any queued captures before disconnecting
+            captures.put(None)
+            worker.join()
+        finally:
+            scope.disconnect()
+            print("Disconnected")
 
 
 if __name__ == "__main__":
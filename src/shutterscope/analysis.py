@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import numpy.typing as npt
 
 from shutterscope.oscilloscope import WaveformData
 
+# Minimum peak-to-peak amplitude (volts) for a capture to contain a pulse
+NOISE_FLOOR_V = 0.05
+# Waveform length (samples) from which three-point channels are measured in
+# parallel; below this, thread start-up costs more than it saves
+PARALLEL_MIN_SAMPLES = 100_000
+
 
-@dataclass
+@dataclass(frozen=True)
 class PulseMetrics:
     """Results from pulse width measurement.
 
@@ -42,67 +53,92 @@ class PulseMeasurementError(Exception):
     """Raised when pulse measurement fails."""
 
 
-def measure_pulse_width(waveform: WaveformData) -> PulseMetrics:
+# Metrics from previous measurements, held until the waveform is discarded.
+# WaveformData is frozen, so a cached result cannot go stale
+_pulse_cache: WeakKeyDictionary[WaveformData, PulseMetrics] = WeakKeyDictionary()
+
+
+def measure_pulse_width(
+    waveform: WaveformData, scratch: npt.NDArray[np.bool_] | None = None
+) -> PulseMetrics:
     """Measure pulse width using 50% threshold crossing.
 
     Finds the first complete pulse in the waveform by detecting where the
     signal crosses the 50% threshold level (midpoint between min and max).
+    Results are cached per waveform, so measuring the same waveform again
+    returns the earlier metrics without rescanning the samples.
 
     Args:
         waveform: Captured waveform data
+        scratch: Optional boolean buffer at least as long as the waveform,
+            used for the threshold comparison instead of allocating a new one
 
     Returns:
         PulseMetrics with timing and voltage information
 
     Raises:
-        PulseMeasurementError: If no complete pulse is found
+        PulseMeasurementError: If the signal is below the noise floor or no
+            complete pulse is found
+        ValueError: If scratch is shorter than the waveform
     """
-    voltages = waveform.voltages
-    sample_rate = waveform.sample_rate
+    metrics = _pulse_cache.get(waveform)
+    if metrics is None:
+        metrics = _measure_pulse_width(waveform, scratch)
+        _pulse_cache[waveform] = metrics
+    return metrics
+
+
+def _measure_pulse_width(
+    waveform: WaveformData, scratch: npt.NDArray[np.bool_] | None
+) -> PulseMetrics:
+    """Measure pulse width without consulting the cache."""
+    dt = waveform.dt
     start_time = waveform.start_time
 
-    if len(voltages) < 2:
+    if len(waveform.voltages) < 2:
         raise PulseMeasurementError("Waveform too short for pulse detection")
 
-    min_v = min(voltages)
-    max_v = max(voltages)
+    voltages = waveform.voltages
+    if scratch is not None and len(scratch) < len(voltages):
+        raise ValueError("Scratch buffer is shorter than the waveform")
+
+    min_v, max_v = waveform.voltage_range
+    if max_v - min_v < NOISE_FLOOR_V:
+        raise PulseMeasurementError("Signal amplitude below noise floor")
     threshold = (min_v + max_v) / 2
 
-    # Find rising edge: signal goes from below to above threshold
-    rising_edge_idx: int | None = None
-    for i in range(len(voltages) - 1):
-        if voltages[i] <= threshold < voltages[i + 1]:
-            rising_edge_idx = i
-            break
+    # Compare every sample against the threshold once; both edges are then
+    # found by searching the mask for the first change of state
+    if scratch is None:
+        above = voltages > threshold
+    else:
+        above = np.greater(voltages, threshold, out=scratch[: len(voltages)])
 
-    if rising_edge_idx is None:
+    # Find rising edge: signal goes from below to above threshold
+    first_low = _find_first(above, False, 0)
+    rise = None if first_low is None else _find_first(above, True, first_low)
+    if rise is None:
         raise PulseMeasurementError("No rising edge found in waveform")
+    rising_edge_idx = rise - 1
 
     # Find falling edge after rising edge: signal goes from above to below threshold
-    falling_edge_idx: int | None = None
-    for i in range(rising_edge_idx + 1, len(voltages) - 1):
-        if voltages[i] > threshold >= voltages[i + 1]:
-            falling_edge_idx = i
-            break
-
-    if falling_edge_idx is None:
+    fall = _find_first(above, False, rise)
+    if fall is None:
         raise PulseMeasurementError("No falling edge found after rising edge")
-
-    # Interpolate to find precise crossing times
-    rising_edge_time = _interpolate_crossing(
-        voltages[rising_edge_idx],
-        voltages[rising_edge_idx + 1],
-        threshold,
-        start_time + rising_edge_idx / sample_rate,
-        1 / sample_rate,
+    falling_edge_idx = fall - 1
+
+    # Interpolate to find precise crossing times. The samples either side of
+    # a crossing lie on opposite sides of the threshold, so v2 - v1 is never 0
+    v1 = float(voltages[rising_edge_idx])
+    v2 = float(voltages[rising_edge_idx + 1])
+    rising_edge_time = (
+        start_time + (rising_edge_idx + (threshold - v1) / (v2 - v1)) * dt
     )
 
-    falling_edge_time = _interpolate_crossing(
-        voltages[falling_edge_idx],
-        voltages[falling_edge_idx + 1],
-        threshold,
-        start_time + falling_edge_idx / sample_rate,
-        1 / sample_rate,
+    v1 = float(voltages[falling_edge_idx])
+    v2 = float(voltages[falling_edge_idx + 1])
+    falling_edge_time = (
+        start_time + (falling_edge_idx + (threshold - v1) / (v2 - v1)) * dt
     )
 
     pulse_width = falling_edge_time - rising_edge_time
@@ -117,28 +153,30 @@ def measure_pulse_width(waveform: WaveformData) -> PulseMetrics:
     )
 
 
-def _interpolate_crossing(
-    v1: float, v2: float, threshold: float, t1: float, dt: float
-) -> float:
-    """Linearly interpolate to find the exact threshold crossing time.
+def _find_first(mask: npt.NDArray[np.bool_], value: bool, start: int) -> int | None:
+    """Find the first index at or after start where mask equals value.
+
+    np.argmax/np.argmin stop at the first match on boolean arrays, so the
+    search only reads as far as the edge it finds.
 
     Args:
-        v1: Voltage at sample before crossing
-        v2: Voltage at sample after crossing
-        threshold: Threshold voltage
-        t1: Time at sample before crossing
-        dt: Time between samples
+        mask: Boolean array to search
+        value: Value to look for
+        start: Index to start searching from
 
     Returns:
-        Interpolated time of threshold crossing
+        Index of the first match, or None if there is none
     """
-    if v2 == v1:
-        return t1
-    fraction = (threshold - v1) / (v2 - v1)
-    return t1 + fraction * dt
+    segment = mask[start:]
+    if segment.size == 0:
+        return None
+    offset = int(np.argmax(segment)) if value else int(np.argmin(segment))
+    if segment[offset] != value:
+        return None
+    return start + offset
 
 
-@dataclass
+@dataclass(frozen=True)
 class ThreePointMetrics:
     """Metrics from three-point shutter measurement.
 
@@ -211,9 +249,27 @@ def measure_three_point(
     Raises:
         PulseMeasurementError: If any channel fails pulse detection
     """
-    first_metrics = measure_pulse_width(waveforms[first_channel])
-    center_metrics = measure_pulse_width(waveforms[center_channel])
-    last_metrics = measure_pulse_width(waveforms[last_channel])
+    channel_waveforms = [
+        waveforms[first_channel],
+        waveforms[center_channel],
+        waveforms[last_channel],
+    ]
+
+    # One allocation provides a separate threshold mask row for each channel
+    length = max(len(waveform.voltages) for waveform in channel_waveforms)
+    scratch = np.empty((len(channel_waveforms), length), dtype=np.bool_)
+
+    # NumPy releases the GIL during the scans, so long channels are measured
+    # concurrently
+    if length < PARALLEL_MIN_SAMPLES:
+        first_metrics, center_metrics, last_metrics = map(
+            measure_pulse_width, channel_waveforms, scratch
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first_metrics, center_metrics, last_metrics = executor.map(
+                measure_pulse_width, channel_waveforms, scratch
+            )
 
     # Calculate timing delays between sensors (rising edge to rising edge)
     first_to_center_delay = (
@@ -41,6 +41,10 @@ class OscilloscopeProtocol(Protocol):
         """
         ...
 
+    def arm(self) -> None:
+        """Arm the oscilloscope for the next single-shot capture."""
+        ...
+
     def wait_for_trigger(self) -> None:
         """Wait indefinitely for the oscilloscope to trigger."""
         ...
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
+import numpy.typing as npt
 import pyvisa
 
 from shutterscope.waveform_data import WaveformData
@@ -13,12 +16,31 @@ if TYPE_CHECKING:
     from pyvisa.resources import MessageBasedResource
 
 
+# Interval between trigger status queries while waiting for a capture
+TRIGGER_POLL_INTERVAL_S = 0.02
+# VISA read size in bytes; larger than a full 250,000 sample :WAVeform:DATA?
+# reply, so each chunk arrives in one low-level read instead of dozens
+VISA_CHUNK_SIZE = 1024 * 1024
+# VISA I/O timeout, long enough for a full chunk over a slow link
+VISA_TIMEOUT_MS = 20000
+
+
 class RigolDS1000Z:
     """Rigol DS1000Z oscilloscope implementation using SCPI over VISA."""
 
     # Valid memory depth values for DS1000Z (single channel)
     MEMORY_DEPTHS = [1000, 10000, 100000, 1000000, 6000000, 12000000]
 
+    # Shared by all instances, as creating one loads the VISA library
+    _resource_manager: ClassVar[pyvisa.ResourceManager | None] = None
+
+    @classmethod
+    def _get_resource_manager(cls) -> pyvisa.ResourceManager:
+        """Return the shared VISA resource manager, creating it on first use."""
+        if cls._resource_manager is None:
+            cls._resource_manager = pyvisa.ResourceManager()
+        return cls._resource_manager
+
     @classmethod
     def auto_connect(cls) -> RigolDS1000Z:
         """Find first Rigol DS1000Z on VISA bus and return connected instance.
@@ -26,12 +48,13 @@ class RigolDS1000Z:
         Raises:
             ConnectionError: If no Rigol DS1000Z oscilloscope is found.
         """
-        rm = pyvisa.ResourceManager()
+        rm = cls._get_resource_manager()
         for resource in rm.list_resources():
             try:
                 instr: MessageBasedResource = rm.open_resource(resource)  # type: ignore[assignment]
                 idn = instr.query("*IDN?")
                 if "RIGOL" in idn and "DS1" in idn:
+                    _configure_session(instr)
                     instance = cls(resource)
                     instance._instrument = instr
                     return instance
@@ -53,12 +76,17 @@ class RigolDS1000Z:
         """
         self._resource = resource
         self._instrument = instrument
+        # Raw sample bytes are staged here; reused across downloads and grown
+        # only when a capture needs more memory depth than seen before
+        self._raw_buffer: npt.NDArray[np.uint8] = np.empty(0, dtype=np.uint8)
 
     def connect(self) -> None:
         """Connect to the oscilloscope."""
         if self._instrument is None:
-            rm = pyvisa.ResourceManager()
-            self._instrument = rm.open_resource(self._resource)  # type: ignore[assignment]
+            rm = self._get_resource_manager()
+            instrument: MessageBasedResource = rm.open_resource(self._resource)  # type: ignore[assignment]
+            _configure_session(instrument)
+            self._instrument = instrument
 
     def disconnect(self) -> None:
         """Disconnect from the oscilloscope."""
@@ -89,9 +117,6 @@ class RigolDS1000Z:
         if channels is None:
             channels = [1]
 
-        # Stop acquisition before changing settings
-        self._instrument.write(":STOP")
-
         # Calculate timebase scale (time per division)
         # DS1000Z has 12 horizontal divisions
         # We want max_duration to fit in ~10 divisions (leaving margin)
@@ -106,26 +131,21 @@ class RigolDS1000Z:
 
         # Find the closest valid memory depth to our requirement
         # Larger depth = higher sample rate (not longer time), so pick closest match
-        memory_depth = self.MEMORY_DEPTHS[0]
-        for depth in self.MEMORY_DEPTHS:
-            if depth <= desired_depth:
-                memory_depth = depth
-            else:
-                # Check if this larger depth is closer than the smaller one
-                if abs(depth - desired_depth) < abs(memory_depth - desired_depth):
-                    memory_depth = depth
-                break
-
-        # Set timebase scale first
-        self._instrument.write(f":TIMebase:MAIN:SCALe {time_per_div}")
-
-        # Set memory depth (must use valid values)
-        self._instrument.write(f":ACQuire:MDEPth {memory_depth}")
+        memory_depth = _closest_memory_depth(self.MEMORY_DEPTHS, desired_depth)
 
         # Set trigger offset to put trigger near right edge of screen
         # Negative offset shifts trigger to the right, showing more pre-trigger data
         trigger_offset = -time_per_div * 5  # 5 divisions to the right
-        self._instrument.write(f":TIMebase:MAIN:OFFSet {trigger_offset}")
+
+        # Sent as one compound message. Order matters: acquisition is stopped
+        # before changing settings, and the timebase scale is set before the
+        # memory depth (which must be one of MEMORY_DEPTHS)
+        commands = [
+            ":STOP",
+            f":TIMebase:MAIN:SCALe {time_per_div}",
+            f":ACQuire:MDEPth {memory_depth}",
+            f":TIMebase:MAIN:OFFSet {trigger_offset}",
+        ]
 
         # Configure vertical scale for each channel
         # 0-2.5V signal with 1 div margin top/bottom
@@ -133,9 +153,11 @@ class RigolDS1000Z:
         # Negative offset moves 0V down on screen
         # To put 0V at 1 div from bottom (3 divs below center): offset = -1.5V
         for channel in channels:
-            self._instrument.write(f":CHAN{channel}:SCALe 0.5")
-            self._instrument.write(f":CHAN{channel}:OFFSet -1.5")
-            self._instrument.write(f":CHAN{channel}:DISPlay ON")
+            commands.append(f":CHAN{channel}:SCALe 0.5")
+            commands.append(f":CHAN{channel}:OFFSet -1.5")
+            commands.append(f":CHAN{channel}:DISPlay ON")
+
+        self._instrument.write(";".join(commands))
 
     def setup_edge_trigger(
         self, channel: int, level: float, slope: str = "NEG"
@@ -150,16 +172,36 @@ class RigolDS1000Z:
         if self._instrument is None:
             raise RuntimeError("Not connected to oscilloscope")
 
-        self._instrument.write(":TRIGger:MODE EDGE")
-        self._instrument.write(f":TRIGger:EDGe:SOURce CHAN{channel}")
-        self._instrument.write(f":TRIGger:EDGe:LEVel {level}")
         slope_cmd = "POSitive" if slope == "POS" else "NEGative"
-        self._instrument.write(f":TRIGger:EDGe:SLOPe {slope_cmd}")
-        self._instrument.write(":TRIGger:SWEep SINGle")
+        commands = [
+            ":TRIGger:MODE EDGE",
+            f":TRIGger:EDGe:SOURce CHAN{channel}",
+            f":TRIGger:EDGe:LEVel {level}",
+            f":TRIGger:EDGe:SLOPe {slope_cmd}",
+            ":TRIGger:SWEep SINGle",
+            ":SINGle",
+        ]
+        self._instrument.write(";".join(commands))
+
+    def arm(self) -> None:
+        """Arm the oscilloscope for the next single-shot capture.
+
+        The trigger settings from setup_edge_trigger are retained by the
+        oscilloscope, so re-arming is a single write.
+        """
+        if self._instrument is None:
+            raise RuntimeError("Not connected to oscilloscope")
+
         self._instrument.write(":SINGle")
 
     def wait_for_trigger(self) -> None:
-        """Wait indefinitely for the oscilloscope to trigger."""
+        """Wait indefinitely for the oscilloscope to trigger.
+
+        The trigger status is polled every TRIGGER_POLL_INTERVAL_S. The
+        DS1000Z has no status event tied to completing a single-shot
+        acquisition (*OPC completes as soon as it is sent), so service
+        requests cannot signal the trigger.
+        """
         if self._instrument is None:
             raise RuntimeError("Not connected to oscilloscope")
 
@@ -167,7 +209,7 @@ class RigolDS1000Z:
             status = self._instrument.query(":TRIGger:STATus?").strip()
             if status in ("TD", "STOP"):
                 return
-            time.sleep(0.1)
+            time.sleep(TRIGGER_POLL_INTERVAL_S)
 
     def get_waveform(self, channel: int) -> WaveformData:
         """Retrieve waveform data from the specified channel using RAW binary mode.
@@ -180,6 +222,25 @@ class RigolDS1000Z:
         Returns:
             WaveformData containing times, voltages, and sample rate
         """
+        return self.get_waveforms([channel])[channel]
+
+    def get_waveforms(self, channels: list[int]) -> dict[int, WaveformData]:
+        """Retrieve waveform data from multiple channels using RAW binary mode.
+
+        All channels are captured with synchronized timing from the same trigger.
+        Acquisition is stopped and the settings for every channel are read
+        once, then each channel's memory is downloaded in turn.
+
+        Args:
+            channels: List of channel numbers (1-4)
+
+        Returns:
+            Dictionary mapping channel number to WaveformData
+
+        Raises:
+            RuntimeError: If not connected, or if the oscilloscope's reply to
+                the settings query has the wrong number of fields
+        """
         if self._instrument is None:
             raise RuntimeError("Not connected to oscilloscope")
 
@@ -187,102 +248,151 @@ class RigolDS1000Z:
         self._instrument.write(":STOP")
         time.sleep(0.1)  # Give scope time to finish stopping
 
-        # Configure waveform source and RAW binary mode
-        self._instrument.write(f":WAVeform:SOURce CHAN{channel}")
-        self._instrument.write(":WAVeform:MODE RAW")
-        self._instrument.write(":WAVeform:FORMat BYTE")
+        # Read every acquisition and channel setting needed below in a single
+        # round trip using a compound query; the replies come back separated
+        # by ";"
+        query = ":ACQuire:MDEPth?;:ACQuire:SRATe?;:TIMebase:MAIN:SCALe?;"
+        query += ":TIMebase:MAIN:OFFSet?"
+        for channel in channels:
+            query += f";:CHAN{channel}:SCALe?;:CHAN{channel}:OFFSet?"
+        replies = self._instrument.query(query).strip().split(";")
+        expected_replies = 4 + 2 * len(channels)
+        if len(replies) != expected_replies:
+            raise RuntimeError(
+                f"Expected {expected_replies} replies to {query!r}, "
+                f"got {len(replies)}: {';'.join(replies)!r}"
+            )
+        mem_depth_str, sample_rate_str, timebase_str, trigger_offset_str = replies[:4]
 
-        # Query actual memory depth to know total points available
-        mem_depth_str = self._instrument.query(":ACQuire:MDEPth?").strip()
-        # Handle "AUTO" or numeric response
+        # Get actual sample rate (preamble x_increment is wrong in RAW mode)
+        sample_rate = float(sample_rate_str)
+
+        # Handle "AUTO" or numeric memory depth
         if mem_depth_str == "AUTO":
-            # Query the actual sample rate and calculate
-            sample_rate = float(self._instrument.query(":ACQuire:SRATe?").strip())
-            timebase_str = self._instrument.query(":TIMebase:MAIN:SCALe?")
-            timebase = float(timebase_str.strip())
+            # Calculate from the sample rate and timebase
+            timebase = float(timebase_str)
             total_points = int(sample_rate * timebase * 12)
         else:
             total_points = int(float(mem_depth_str))
 
-        # Set initial range to get preamble with correct scaling
-        self._instrument.write(":WAVeform:STARt 1")
-        self._instrument.write(f":WAVeform:STOP {min(total_points, 250000)}")
-
-        # Calculate y_increment from channel scale instead of trusting the preamble
-        # The preamble values can be wrong in RAW mode (firmware bug)
-        # DS1000Z has 8-bit ADC (256 levels) and 8 vertical divisions
-        # y_increment = (scale_per_div * 8_divisions) / 256_levels = scale / 32
-        chan_scale = float(self._instrument.query(f":CHAN{channel}:SCALe?").strip())
-        y_increment = chan_scale / 32.0
-
-        # Get channel offset for voltage calculation
-        chan_offset = float(self._instrument.query(f":CHAN{channel}:OFFSet?").strip())
-
-        # For RAW mode byte->voltage conversion:
-        # - Raw bytes are unsigned 8-bit (0-255)
-        # - Center of ADC range is 128, representing the channel's offset voltage
-        # - voltage = (byte - 128) * y_increment + chan_offset
-        y_reference = 128.0
-
-        # Get actual sample rate (preamble x_increment is wrong in RAW mode)
-        sample_rate = float(self._instrument.query(":ACQuire:SRATe?").strip())
-
         # Calculate x_origin for RAW mode
         # In RAW mode, we download the entire memory buffer. The trigger point
         # is at a specific position within this buffer, determined by the
         # trigger offset setting. Total duration = total_points / sample_rate.
         # The trigger offset tells us where t=0 is relative to screen center.
         total_duration = total_points / sample_rate
-        trigger_offset = float(self._instrument.query(":TIMebase:MAIN:OFFSet?").strip())
+        trigger_offset = float(trigger_offset_str)
         # With negative trigger offset, trigger is to the right of center,
         # meaning more pre-trigger data. The start of memory is at:
         # -(half of total duration) + trigger_offset
         # (trigger_offset is negative when trigger is right of center)
         x_origin = -(total_duration / 2) + trigger_offset
 
+        # For RAW mode byte->voltage conversion:
+        # - Raw bytes are unsigned 8-bit (0-255)
+        # - Center of ADC range is 128, representing the channel's offset voltage
+        # - voltage = (byte - 128) * y_increment + chan_offset
+        y_reference = 128.0
+
+        waveforms = {}
+        for i, channel in enumerate(channels):
+            chan_scale_str, chan_offset_str = replies[4 + 2 * i : 6 + 2 * i]
+
+            # Calculate y_increment from channel scale instead of trusting the
+            # preamble. The preamble values can be wrong in RAW mode (firmware bug)
+            # DS1000Z has 8-bit ADC (256 levels) and 8 vertical divisions
+            # y_increment = (scale_per_div * 8_divisions) / 256_levels = scale / 32
+            y_increment = float(chan_scale_str) / 32.0
+
+            # Get channel offset for voltage calculation
+            chan_offset = float(chan_offset_str)
+
+            raw = self._download_raw(channel, total_points)
+
+            # Convert bytes to voltages
+            # Raw byte 128 = center of display = chan_offset voltage
+            # voltage = (byte - 128) * y_increment - chan_offset
+            # (subtract offset because positive offset moves trace down)
+            # Rearranged as byte * y_increment - (128 * y_increment + chan_offset)
+            # so it takes one multiply pass into a new float32 array and one
+            # in-place subtract. The array is not shared with the staging
+            # buffer, so the waveform stays valid after the next download
+            voltages = np.multiply(raw, np.float32(y_increment), dtype=np.float32)
+            voltages -= np.float32(y_reference * y_increment + chan_offset)
+
+            waveforms[channel] = WaveformData(
+                voltages=voltages, sample_rate=sample_rate, start_time=x_origin
+            )
+        return waveforms
+
+    def _download_raw(self, channel: int, total_points: int) -> npt.NDArray[np.uint8]:
+        """Download a channel's sample memory as raw bytes.
+
+        Args:
+            channel: Channel number (1-4)
+            total_points: Number of samples in the oscilloscope's memory
+
+        Returns:
+            View of the staging buffer holding the received bytes, valid until
+            the next download
+        """
+        if self._instrument is None:
+            raise RuntimeError("Not connected to oscilloscope")
+
+        # Configure waveform source and RAW binary mode
+        self._instrument.write(
+            f":WAVeform:SOURce CHAN{channel};:WAVeform:MODE RAW;:WAVeform:FORMat BYTE"
+        )
+
         # Read data in chunks (max 250000 points per read for stability)
+        # Each chunk is decoded straight into a uint8 array by pyvisa, so the
+        # samples never exist as individual Python ints, and copied into the
+        # staging buffer
         chunk_size = 250000
-        raw_bytes: list[float] = []
+        if len(self._raw_buffer) < total_points:
+            self._raw_buffer = np.empty(total_points, dtype=np.uint8)
+        raw = self._raw_buffer
+        received = 0
 
         for start in range(1, total_points + 1, chunk_size):
             stop = min(start + chunk_size - 1, total_points)
-            self._instrument.write(f":WAVeform:STARt {start}")
-            self._instrument.write(f":WAVeform:STOP {stop}")
-
-            # Read binary data (returns unsigned bytes)
-            chunk = list(
-                self._instrument.query_binary_values(
-                    ":WAVeform:DATA?", datatype="B", container=list
-                )
+
+            # Set the range and read binary data (returns unsigned bytes) in
+            # one message; the only reply is the data block
+            chunk = self._instrument.query_binary_values(
+                f":WAVeform:STARt {start};:WAVeform:STOP {stop};:WAVeform:DATA?",
+                datatype="B",
+                container=np.ndarray,
             )
-            raw_bytes.extend(chunk)
-
-        # Convert bytes to voltages
-        # Raw byte 128 = center of display = chan_offset voltage
-        # voltage = (byte - 128) * y_increment - chan_offset
-        # (subtract offset because positive offset moves trace down)
-        voltages = [
-            (byte_val - y_reference) * y_increment - chan_offset
-            for byte_val in raw_bytes
-        ]
+            raw[received : received + len(chunk)] = chunk
+            received += len(chunk)
 
-        return WaveformData(
-            voltages=voltages, sample_rate=sample_rate, start_time=x_origin
-        )
+        return raw[:received]
 
-    def get_waveforms(self, channels: list[int]) -> dict[int, WaveformData]:
-        """Retrieve waveform data from multiple channels.
 
-        All channels are captured with synchronized timing from the same trigger.
-        Downloads each channel sequentially after the trigger completes.
+def _configure_session(instrument: MessageBasedResource) -> None:
+    """Apply the read size and timeout used for waveform downloads.
 
-        Args:
-            channels: List of channel numbers (1-4)
+    Args:
+        instrument: Newly opened VISA instrument
+    """
+    instrument.chunk_size = VISA_CHUNK_SIZE
+    instrument.timeout = VISA_TIMEOUT_MS
 
-        Returns:
-            Dictionary mapping channel number to WaveformData
-        """
-        waveforms = {}
-        for channel in channels:
-            waveforms[channel] = self.get_waveform(channel)
-        return waveforms
+
+def _closest_memory_depth(depths: list[int], desired_depth: int) -> int:
+    """Pick the valid memory depth closest to the desired depth.
+
+    Args:
+        depths: Valid memory depths in ascending order
+        desired_depth: Memory depth needed for the requested sample interval
+
+    Returns:
+        The closest depth, preferring the smaller one on a tie
+    """
+    i = bisect.bisect_right(depths, desired_depth)
+    lower = depths[max(i - 1, 0)]
+    upper = depths[min(i, len(depths) - 1)]
+    if abs(upper - desired_depth) < abs(lower - desired_depth):
+        return upper
+    return lower
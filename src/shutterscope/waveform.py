@@ -2,64 +2,145 @@
 
 from __future__ import annotations
 
-import json
+import threading
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
-import matplotlib.pyplot as plt
+import numpy as np
+import numpy.typing as npt
+import orjson
 
 from shutterscope.oscilloscope import WaveformData
 
 if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
     from shutterscope.analysis import PulseMetrics, ThreePointMetrics
 
 # Current JSON schema version
 WAVEFORM_JSON_VERSION = 1
 
+# CSV row format and number of rows formatted per write
+_CSV_ROW = "%.9g,%.6g\n"
+_CSV_BLOCK_ROWS = 1 << 16
 
-def save_waveform_json(
-    data: WaveformData, filename: str, metrics: PulseMetrics | None = None
-) -> None:
-    """Save waveform data to a JSON file.
+# Resolution of saved plots, and how many samples per pixel a waveform may
+# have before it is reduced to per-pixel minimum and maximum for plotting
+_PLOT_DPI = 150
+_PLOT_DECIMATE_FACTOR = 4
 
-    Args:
-        data: WaveformData to save
-        filename: Path to the output JSON file
-        metrics: Optional pulse metrics to include in the file
-    """
+
+class _PlotFigures(threading.local):
+    """Plot figures kept for reuse by the current thread, keyed by size."""
+
+    def __init__(self) -> None:
+        self.figures: dict[tuple[float, float], tuple[Figure, Axes]] = {}
+
+
+_plot_figures = _PlotFigures()
+
+
+def _waveform_output(
+    data: WaveformData, metrics: PulseMetrics | None
+) -> dict[str, object]:
+    """Build the single-point file contents, excluding the samples."""
     output: dict[str, object] = {
         "version": WAVEFORM_JSON_VERSION,
         "capture_time": datetime.now(UTC).isoformat(),
         "sample_rate_hz": data.sample_rate,
         "start_time_s": data.start_time,
-        "samples": [round(v, 6) for v in data.voltages],
     }
 
     if metrics is not None:
         output["shutter_speed_s"] = metrics.pulse_width_s
         output["shutter_speed_fraction"] = metrics.shutter_speed_fraction
 
-    with open(filename, "w") as f:
-        json.dump(output, f)
+    return output
+
+
+def _write_json(output: dict[str, object], filename: str) -> None:
+    """Write a dictionary to a JSON file.
+
+    orjson serializes sample arrays directly without boxing each value.
+    """
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+def save_waveform_json(
+    data: WaveformData, filename: str, metrics: PulseMetrics | None = None
+) -> None:
+    """Save waveform data to a JSON file.
+
+    Args:
+        data: WaveformData to save
+        filename: Path to the output JSON file
+        metrics: Optional pulse metrics to include in the file
+    """
+    output = _waveform_output(data, metrics)
+    output["samples"] = np.round(data.voltages, 6)
+    _write_json(output, filename)
+
+
+def save_waveform_npy(
+    data: WaveformData, filename: str, metrics: PulseMetrics | None = None
+) -> None:
+    """Save waveform samples to a binary .npy file with a JSON sidecar.
+
+    The samples are written next to filename with a .npy suffix. filename
+    holds the same metadata as save_waveform_json, with a "samples_file"
+    reference in place of the samples. At 4 bytes per sample this is much
+    smaller and faster to write than JSON text for long captures.
+
+    Args:
+        data: WaveformData to save
+        filename: Path to the output JSON sidecar file
+        metrics: Optional pulse metrics to include in the sidecar
+    """
+    samples_path = Path(filename).with_suffix(".npy")
+    np.save(samples_path, data.voltages)
+
+    output = _waveform_output(data, metrics)
+    output["samples_file"] = samples_path.name
+    _write_json(output, filename)
 
 
 def load_waveform_json(filename: str) -> WaveformData:
     """Load waveform data from a JSON file.
 
+    Files written by save_waveform_npy are also supported; their samples are
+    memory-mapped from the .npy file rather than read into memory.
+
     Args:
         filename: Path to the input JSON file
 
     Returns:
         WaveformData reconstructed from the file
+
+    Raises:
+        ValueError: If the file has an unsupported version or holds a
+            three-point capture
     """
-    with open(filename) as f:
-        data = json.load(f)
+    with open(filename, "rb") as f:
+        data = orjson.loads(f.read())
 
     if data.get("version") != WAVEFORM_JSON_VERSION:
         raise ValueError(f"Unsupported waveform file version: {data.get('version')}")
+    if data.get("mode") == "three_point":
+        raise ValueError(
+            f"{filename} holds a three-point capture, not a single waveform"
+        )
+
+    if "samples_file" in data:
+        samples_path = Path(filename).with_name(data["samples_file"])
+        voltages = np.load(samples_path, mmap_mode="r")
+    else:
+        voltages = data["samples"]
 
     return WaveformData(
-        voltages=data["samples"],
+        voltages=voltages,
         sample_rate=data["sample_rate_hz"],
         start_time=data["start_time_s"],
     )
@@ -75,8 +156,77 @@ def save_waveform_csv(data: WaveformData, filename: str) -> None:
     times = data.get_times()
     with open(filename, "w") as f:
         f.write("time_s,voltage_v\n")
-        for t, v in zip(times, data.voltages, strict=True):
-            f.write(f"{t:.9g},{v:.6g}\n")
+        # Rows are formatted a block at a time with one % operation, which
+        # keeps the per-sample work in C without holding the whole file
+        for start in range(0, len(times), _CSV_BLOCK_ROWS):
+            stop = start + _CSV_BLOCK_ROWS
+            block = np.column_stack((times[start:stop], data.voltages[start:stop]))
+            f.write(_CSV_ROW * len(block) % tuple(block.ravel().tolist()))
+
+
+def _plot_axes(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return a cleared figure and axes of the given size for this thread.
+
+    Figures are reused between saves rather than created for each capture.
+    Each thread has its own, as matplotlib figures are not thread-safe.
+
+    Args:
+        figsize: Figure size in inches
+
+    Returns:
+        Tuple of figure and its single axes, with the axes cleared
+    """
+    # matplotlib is imported on demand as it dominates startup time. Figure is
+    # used directly rather than pyplot so plots can be saved from a worker
+    # thread without touching a GUI backend
+    from matplotlib.figure import Figure
+
+    figures = _plot_figures.figures
+    if figsize not in figures:
+        fig = Figure(figsize=figsize)
+        figures[figsize] = (fig, fig.subplots())
+
+    fig, ax = figures[figsize]
+    ax.clear()
+    return fig, ax
+
+
+def _plot_width_px(fig: Figure) -> int:
+    """Return the width of a saved plot in pixels."""
+    return int(fig.get_figwidth() * _PLOT_DPI)
+
+
+def _plot_points(
+    data: WaveformData, width_px: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float32]]:
+    """Return times in milliseconds and voltages to plot for a waveform.
+
+    Captures with many more samples than the plot has pixels are reduced to
+    the minimum and maximum of each pixel-wide bin, which renders the same
+    image while drawing a fraction of the line segments.
+
+    Args:
+        data: WaveformData to plot
+        width_px: Width of the plot in pixels
+
+    Returns:
+        Tuple of times in milliseconds and the matching voltages
+    """
+    n = len(data.voltages)
+    if n <= _PLOT_DECIMATE_FACTOR * width_px:
+        # Convert times to milliseconds for readability, in place as
+        # get_times returns a fresh array
+        times_ms = data.get_times()
+        times_ms *= 1000
+        return times_ms, data.voltages
+
+    starts = np.linspace(0, n, width_px, endpoint=False).astype(np.intp)
+    voltages = np.empty(2 * width_px, dtype=np.float32)
+    voltages[0::2] = np.minimum.reduceat(data.voltages, starts)
+    voltages[1::2] = np.maximum.reduceat(data.voltages, starts)
+    times_ms = np.repeat(data.start_time + starts / data.sample_rate, 2)
+    times_ms *= 1000
+    return times_ms, voltages
 
 
 def save_waveform_plot(data: WaveformData, filename: str) -> None:
@@ -86,11 +236,9 @@ def save_waveform_plot(data: WaveformData, filename: str) -> None:
         data: WaveformData to plot
         filename: Path to the output image file (e.g., .png)
     """
-    # Convert times to milliseconds for readability
-    times_ms = [t * 1000 for t in data.get_times()]
-
-    fig, ax = plt.subplots(figsize=(12, 4))
-    ax.plot(times_ms, data.voltages, linewidth=0.5)
+    fig, ax = _plot_axes((12, 4))
+    times_ms, voltages = _plot_points(data, _plot_width_px(fig))
+    ax.plot(times_ms, voltages, linewidth=0.5)
     ax.set_xlabel("Time (ms)")
     ax.set_ylabel("Voltage (V)")
     ax.set_title("Single-Point Shutter Measurement")
@@ -100,8 +248,7 @@ def save_waveform_plot(data: WaveformData, filename: str) -> None:
     ax.legend()
 
     fig.tight_layout()
-    fig.savefig(filename, dpi=150)
-    plt.close(fig)
+    fig.savefig(filename, dpi=_PLOT_DPI)
 
 
 def save_three_point_plot(
@@ -122,13 +269,14 @@ def save_three_point_plot(
     # Define colors to match Rigol DS1000Z channel colors (darkened for visibility)
     colors = {1: "#D4AA00", 2: "#00CCCC", 3: "#CC00CC"}  # Dark Yellow, Cyan, Magenta
 
-    fig, ax = plt.subplots(figsize=(12, 5))
+    fig, ax = _plot_axes((12, 5))
 
+    width_px = _plot_width_px(fig)
     for channel, waveform in sorted(waveforms.items()):
-        times_ms = [t * 1000 for t in waveform.get_times()]
+        times_ms, voltages = _plot_points(waveform, width_px)
         label = channel_labels.get(channel, f"Channel {channel}")
         color = colors.get(channel)
-        ax.plot(times_ms, waveform.voltages, linewidth=0.8, label=label, color=color)
+        ax.plot(times_ms, voltages, linewidth=0.8, label=label, color=color)
 
     ax.set_xlabel("Time (ms)")
     ax.set_ylabel("Voltage (V)")
@@ -139,22 +287,13 @@ def save_three_point_plot(
     ax.legend(loc="upper right")
 
     fig.tight_layout()
-    fig.savefig(filename, dpi=150)
-    plt.close(fig)
+    fig.savefig(filename, dpi=_PLOT_DPI)
 
 
-def save_three_point_json(
-    waveforms: dict[int, WaveformData],
-    filename: str,
-    metrics: ThreePointMetrics | None = None,
-) -> None:
-    """Save three-point waveform data to a JSON file.
-
-    Args:
-        waveforms: Dictionary of channel -> WaveformData
-        filename: Path to the output JSON file
-        metrics: Optional three-point metrics to include in the file
-    """
+def _three_point_output(
+    waveforms: dict[int, WaveformData], metrics: ThreePointMetrics | None
+) -> dict[str, object]:
+    """Build the three-point file contents, excluding the samples."""
     output: dict[str, object] = {
         "version": WAVEFORM_JSON_VERSION,
         "mode": "three_point",
@@ -170,7 +309,6 @@ def save_three_point_json(
             "label": channel_labels.get(channel, f"channel_{channel}"),
             "sample_rate_hz": waveform.sample_rate,
             "start_time_s": waveform.start_time,
-            "samples": [round(v, 6) for v in waveform.voltages],
         }
     output["channels"] = channels_data
 
@@ -196,5 +334,48 @@ def save_three_point_json(
             "timing_uniformity": metrics.timing_uniformity,
         }
 
-    with open(filename, "w") as f:
-        json.dump(output, f)
+    return output
+
+
+def save_three_point_json(
+    waveforms: dict[int, WaveformData],
+    filename: str,
+    metrics: ThreePointMetrics | None = None,
+) -> None:
+    """Save three-point waveform data to a JSON file.
+
+    Args:
+        waveforms: Dictionary of channel -> WaveformData
+        filename: Path to the output JSON file
+        metrics: Optional three-point metrics to include in the file
+    """
+    output = _three_point_output(waveforms, metrics)
+    channels_data = cast(dict[str, dict[str, object]], output["channels"])
+    for channel, waveform in waveforms.items():
+        channels_data[str(channel)]["samples"] = np.round(waveform.voltages, 6)
+    _write_json(output, filename)
+
+
+def save_three_point_npy(
+    waveforms: dict[int, WaveformData],
+    filename: str,
+    metrics: ThreePointMetrics | None = None,
+) -> None:
+    """Save three-point waveform samples to a binary .npz file with a JSON sidecar.
+
+    Each channel's samples are stored in the .npz under its channel number.
+    filename holds the same metadata as save_three_point_json, with a
+    "samples_file" reference in place of the samples.
+
+    Args:
+        waveforms: Dictionary of channel -> WaveformData
+        filename: Path to the output JSON sidecar file
+        metrics: Optional three-point metrics to include in the sidecar
+    """
+    samples_path = Path(filename).with_suffix(".npz")
+    arrays: dict[str, Any] = {str(ch): wf.voltages for ch, wf in waveforms.items()}
+    np.savez(samples_path, **arrays)
+
+    output = _three_point_output(waveforms, metrics)
+    output["samples_file"] = samples_path.name
+    _write_json(output, filename)
@@ -2,26 +2,81 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cached_property
 
+import numpy as np
+import numpy.typing as npt
 
-@dataclass
+# Samples reduced at a time by voltage_range (1 MB of float32, fits in L2 cache)
+_RANGE_BLOCK_SIZE = 1 << 18
+
+
+@dataclass(frozen=True, eq=False)
 class WaveformData:
     """Captured waveform data from an oscilloscope.
 
     Stores voltage samples with uniform time spacing. Time values can be
     reconstructed as: time[i] = start_time + i / sample_rate
+
+    Voltages are held as a contiguous float32 array; any sequence of numbers
+    passed to the constructor is converted on creation. Instances are frozen,
+    so derived values such as dt and voltage_range can be cached safely; use
+    dataclasses.replace to change a field. The voltages array must not be
+    modified in place. Instances compare and hash by identity, as element-wise
+    array comparison has no single truth value.
     """
 
-    voltages: list[float]
+    voltages: npt.NDArray[np.float32]
     sample_rate: float
     start_time: float
 
-    def get_times(self) -> list[float]:
+    def __init__(
+        self, voltages: npt.ArrayLike, sample_rate: float, start_time: float
+    ) -> None:
+        """Create a waveform, converting voltages to a float32 array.
+
+        Args:
+            voltages: Voltage samples as any array-like of numbers
+            sample_rate: Samples per second
+            start_time: Time of the first sample relative to the trigger, in
+                seconds
+        """
+        # Fields are set through object.__setattr__ as the dataclass is frozen
+        object.__setattr__(self, "voltages", np.asarray(voltages, dtype=np.float32))
+        object.__setattr__(self, "sample_rate", sample_rate)
+        object.__setattr__(self, "start_time", start_time)
+
+    @cached_property
+    def dt(self) -> float:
+        """Time between samples in seconds."""
+        return 1.0 / self.sample_rate
+
+    @cached_property
+    def voltage_range(self) -> tuple[float, float]:
+        """Minimum and maximum voltage, computed once per waveform.
+
+        Long waveforms are reduced in cache-sized blocks, so the samples are
+        read from memory once for both the minimum and the maximum.
+
+        Raises:
+            ValueError: If the waveform has no samples
+        """
+        voltages = self.voltages
+        min_v = float(voltages[:_RANGE_BLOCK_SIZE].min())
+        max_v = float(voltages[:_RANGE_BLOCK_SIZE].max())
+        for start in range(_RANGE_BLOCK_SIZE, len(voltages), _RANGE_BLOCK_SIZE):
+            block = voltages[start : start + _RANGE_BLOCK_SIZE]
+            min_v = min(min_v, float(block.min()))
+            max_v = max(max_v, float(block.max()))
+        return min_v, max_v
+
+    def get_times(self) -> npt.NDArray[np.float64]:
         """Generate time values for each sample."""
-        return [
-            self.start_time + i / self.sample_rate for i in range(len(self.voltages))
-        ]
+        times: npt.NDArray[np.float64] = (
+            self.start_time + np.arange(len(self.voltages)) / self.sample_rate
+        )
+        return times
 
     def trim(self, start_time: float, end_time: float) -> WaveformData:
         """Return a new WaveformData trimmed to the specified time range.
@@ -31,15 +86,16 @@ class WaveformData:
             end_time: End of trim window in seconds
 
         Returns:
-            New WaveformData containing only samples within the time range
+            New WaveformData containing only samples within the time range.
+            Its voltages are a view into this waveform's array, not a copy.
         """
         start_idx = max(0, int((start_time - self.start_time) * self.sample_rate))
         end_idx = min(
             len(self.voltages), int((end_time - self.start_time) * self.sample_rate)
         )
 
-        return WaveformData(
+        return replace(
+            self,
             voltages=self.voltages[start_idx:end_idx],
-            sample_rate=self.sample_rate,
             start_time=self.start_time + start_idx / self.sample_rate,
         )
@@ -1,5 +1,6 @@
 """Shared test fixtures for ShutterScope tests."""
 
+import numpy as np
 import pytest
 
 from shutterscope.oscilloscope import WaveformData
@@ -32,6 +33,9 @@ class MockOscilloscope:
     ) -> None:
         pass
 
+    def arm(self) -> None:
+        pass
+
     def wait_for_trigger(self) -> None:
         pass
 
@@ -39,7 +43,8 @@ class MockOscilloscope:
         if self._waveform_data is not None:
             return self._waveform_data
         # Return a simple test waveform: 100 samples at 1MHz
-        voltages = [0.0 if i < 20 or i >= 80 else 3.3 for i in range(100)]
+        voltages = np.zeros(100, dtype=np.float32)
+        voltages[20:80] = 3.3
         return WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
 
     def get_waveforms(self, channels: list[int]) -> dict[int, WaveformData]:
@@ -51,10 +56,8 @@ class MockOscilloscope:
         for i, channel in enumerate(channels):
             # Offset pulses by 5 samples each to simulate shutter travel
             offset = i * 5
-            voltages = [
-                0.0 if j < (20 + offset) or j >= (80 + offset) else 3.3
-                for j in range(100)
-            ]
+            voltages = np.zeros(100, dtype=np.float32)
+            voltages[20 + offset : 80 + offset] = 3.3
             result[channel] = WaveformData(
                 voltages=voltages, sample_rate=1e6, start_time=0.0
             )
@@ -1,5 +1,8 @@
 """Tests for pulse analysis."""
 
+from dataclasses import FrozenInstanceError, replace
+
+import numpy as np
 import pytest
 
 from shutterscope.analysis import (
@@ -22,7 +25,7 @@ def test_measure_pulse_width_ideal_square_pulse() -> None:
     # Pulse should be 60µs = 0.00006s
     assert metrics.pulse_width_s == pytest.approx(60e-6, rel=0.01)
     assert metrics.min_v == 0.0
-    assert metrics.max_v == 3.3
+    assert metrics.max_v == pytest.approx(3.3)
     assert metrics.threshold_v == pytest.approx(1.65)
 
 
@@ -57,16 +60,49 @@ def test_measure_pulse_width_with_negative_start_time() -> None:
     assert metrics.pulse_width_s == pytest.approx(80e-6, rel=0.01)
 
 
+def test_measure_pulse_width_starts_above_threshold() -> None:
+    """Test that a capture starting mid-pulse skips to the next full pulse."""
+    # Tail of a previous pulse, then low, then a 30µs pulse
+    voltages = [3.3] * 10 + [0.0] * 20 + [3.3] * 30 + [0.0] * 40
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    metrics = measure_pulse_width(waveform)
+
+    assert metrics.rising_edge_time == pytest.approx(29.5e-6, rel=0.01)
+    assert metrics.pulse_width_s == pytest.approx(30e-6, rel=0.01)
+
+
+def test_measure_pulse_width_measures_first_of_several_pulses() -> None:
+    """Test that only the first complete pulse is measured."""
+    voltages = [0.0] * 10 + [3.3] * 20 + [0.0] * 10 + [3.3] * 40 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    metrics = measure_pulse_width(waveform)
+
+    assert metrics.rising_edge_time == pytest.approx(9.5e-6, rel=0.01)
+    assert metrics.falling_edge_time == pytest.approx(29.5e-6, rel=0.01)
+
+
 def test_measure_pulse_width_no_rising_edge() -> None:
     """Test error when no rising edge is found."""
-    # All low signal
-    voltages = [0.0] * 100
+    # Signal starts high and only falls
+    voltages = [3.3] * 50 + [0.0] * 50
     waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
 
     with pytest.raises(PulseMeasurementError, match="No rising edge"):
         measure_pulse_width(waveform)
 
 
+def test_measure_pulse_width_below_noise_floor() -> None:
+    """Test early rejection of a capture with no significant signal."""
+    # 20mV of noise on an otherwise flat trace
+    voltages = [0.0, 0.02] * 50
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    with pytest.raises(PulseMeasurementError, match="noise floor"):
+        measure_pulse_width(waveform)
+
+
 def test_measure_pulse_width_no_falling_edge() -> None:
     """Test error when rising edge found but no falling edge."""
     # Signal goes high but never comes back down
@@ -85,23 +121,108 @@ def test_measure_pulse_width_waveform_too_short() -> None:
         measure_pulse_width(waveform)
 
 
-def test_pulse_metrics_pulse_width_ms() -> None:
-    """Test pulse_width_ms property."""
-    metrics = PulseMetrics(
-        pulse_width_s=0.008,
-        rising_edge_time=-0.004,
-        falling_edge_time=0.004,
-        threshold_v=1.65,
-        min_v=0.0,
-        max_v=3.3,
+def test_measure_pulse_width_scratch_buffer() -> None:
+    """Test that a longer scratch buffer is used for the threshold mask."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    scratch = np.ones(150, dtype=np.bool_)
+
+    metrics = measure_pulse_width(waveform, scratch)
+
+    # A separate waveform is measured without scratch, so the result is not
+    # read back from the cache
+    unscratched = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    expected = measure_pulse_width(unscratched)
+    assert metrics is not expected
+    assert metrics == expected
+    assert scratch[:100].sum() == 60
+
+
+def test_measure_pulse_width_scratch_buffer_too_short() -> None:
+    """Test error when the scratch buffer cannot hold the mask."""
+    waveform = WaveformData(voltages=[0.0] * 100, sample_rate=1e6, start_time=0.0)
+
+    with pytest.raises(ValueError, match="Scratch buffer"):
+        measure_pulse_width(waveform, np.empty(50, dtype=np.bool_))
+
+
+def test_measure_pulse_width_caches_result() -> None:
+    """Test that measuring a waveform again reuses the earlier result."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    metrics = measure_pulse_width(waveform)
+
+    assert measure_pulse_width(waveform) is metrics
+
+
+def test_measure_pulse_width_replaced_voltages() -> None:
+    """Test that a waveform with replaced voltages is measured afresh."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    measure_pulse_width(waveform)
+
+    replaced = replace(
+        waveform, voltages=np.array([0.0] * 20 + [10.0] * 30 + [0.0] * 50)
     )
+    metrics = measure_pulse_width(replaced)
+
+    assert metrics.pulse_width_s == pytest.approx(30e-6, rel=0.01)
+    assert metrics.max_v == pytest.approx(10.0)
+    assert metrics.threshold_v == pytest.approx(5.0)
+
+
+def test_measure_pulse_width_replaced_sample_rate() -> None:
+    """Test that a waveform with a replaced sample rate is measured afresh."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    measure_pulse_width(waveform)
+
+    metrics = measure_pulse_width(replace(waveform, sample_rate=2e6))
+
+    assert metrics.pulse_width_s == pytest.approx(30e-6, rel=0.01)
 
-    assert metrics.pulse_width_ms == 8.0
 
+def test_measure_pulse_width_replaced_start_time() -> None:
+    """Test that a waveform with a replaced start time is measured afresh."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    measure_pulse_width(waveform)
+
+    metrics = measure_pulse_width(replace(waveform, start_time=-50e-6))
+
+    assert metrics.rising_edge_time == pytest.approx(-30.5e-6, rel=0.01)
+
+
+@pytest.mark.parametrize("field", ["voltages", "sample_rate", "start_time"])
+def test_measured_waveform_fields_cannot_be_reassigned(field: str) -> None:
+    """Test that a measured waveform cannot change under its cached metrics."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    metrics = measure_pulse_width(waveform)
+
+    with pytest.raises(FrozenInstanceError):
+        setattr(waveform, field, 2e6)
+
+    assert measure_pulse_width(waveform) is metrics
 
-def test_pulse_metrics_shutter_speed_fraction() -> None:
-    """Test shutter_speed_fraction property."""
-    # 1/125 second shutter
+
+def test_cached_pulse_metrics_cannot_be_modified() -> None:
+    """Test that a caller cannot change the metrics cached for a waveform."""
+    voltages = [0.0] * 20 + [3.3] * 60 + [0.0] * 20
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    metrics = measure_pulse_width(waveform)
+
+    with pytest.raises(FrozenInstanceError):
+        metrics.rising_edge_time = 0.0  # type: ignore[misc]
+
+    assert measure_pulse_width(waveform).rising_edge_time == pytest.approx(
+        19.5e-6, rel=0.01
+    )
+
+
+def test_pulse_metrics_pulse_width_ms() -> None:
+    """Test pulse_width_ms property."""
     metrics = PulseMetrics(
         pulse_width_s=0.008,
         rising_edge_time=-0.004,
@@ -111,65 +232,57 @@ def test_pulse_metrics_shutter_speed_fraction() -> None:
         max_v=3.3,
     )
 
-    assert metrics.shutter_speed_fraction == "1/125"
+    assert metrics.pulse_width_ms == 8.0
 
 
-def test_pulse_metrics_shutter_speed_fraction_fast() -> None:
-    """Test shutter_speed_fraction for fast shutter."""
-    # 1/1000 second shutter
+@pytest.mark.parametrize(
+    ("pulse_width_s", "expected"),
+    [
+        (0.008, "1/125"),
+        (0.001, "1/1000"),
+        (0.0333, "1/30"),
+    ],
+)
+def test_pulse_metrics_shutter_speed_fraction(
+    pulse_width_s: float, expected: str
+) -> None:
+    """Test shutter_speed_fraction for normal, fast and slow shutters."""
     metrics = PulseMetrics(
-        pulse_width_s=0.001,
-        rising_edge_time=-0.0005,
-        falling_edge_time=0.0005,
+        pulse_width_s=pulse_width_s,
+        rising_edge_time=-pulse_width_s / 2,
+        falling_edge_time=pulse_width_s / 2,
         threshold_v=1.65,
         min_v=0.0,
         max_v=3.3,
     )
 
-    assert metrics.shutter_speed_fraction == "1/1000"
+    assert metrics.shutter_speed_fraction == expected
 
 
-def test_pulse_metrics_shutter_speed_fraction_slow() -> None:
-    """Test shutter_speed_fraction for slow shutter."""
-    # 1/30 second shutter
-    metrics = PulseMetrics(
-        pulse_width_s=0.0333,
-        rising_edge_time=-0.01665,
-        falling_edge_time=0.01665,
-        threshold_v=1.65,
-        min_v=0.0,
-        max_v=3.3,
-    )
+# Three-point measurement tests
 
-    assert metrics.shutter_speed_fraction == "1/30"
 
+@pytest.fixture
+def staggered_waveforms() -> dict[int, WaveformData]:
+    """Provide three 60µs pulses rising 10µs apart on channels 1-3.
 
-# Three-point measurement tests
+    Simulates a shutter traveling across the three sensors.
+    """
+    waveforms = {}
+    for channel in (1, 2, 3):
+        voltages = np.zeros(100)
+        voltages[channel * 10 : channel * 10 + 60] = 3.3
+        waveforms[channel] = WaveformData(
+            voltages=voltages, sample_rate=1e6, start_time=0.0
+        )
+    return waveforms
 
 
-def test_measure_three_point_basic() -> None:
+def test_measure_three_point_basic(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test basic three-point measurement with offset pulses."""
-    # Create three waveforms with staggered pulse start times
-    # Simulates shutter traveling across sensors with 10µs between each
-    waveforms = {
-        1: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        2: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
-
-    metrics = measure_three_point(waveforms)
+    metrics = measure_three_point(staggered_waveforms)
 
     # All three pulses should be 60µs
     assert metrics.first.pulse_width_s == pytest.approx(60e-6, rel=0.01)
@@ -184,77 +297,29 @@ def test_measure_three_point_basic() -> None:
     assert metrics.shutter_travel_time_s == pytest.approx(20e-6, rel=0.01)
 
 
-def test_measure_three_point_horizontal_orientation() -> None:
+def test_measure_three_point_horizontal_orientation(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test three-point measurement with horizontal orientation."""
-    waveforms = {
-        1: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        2: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
-
-    metrics = measure_three_point(waveforms, orientation="horizontal")
+    metrics = measure_three_point(staggered_waveforms, orientation="horizontal")
 
     assert metrics.orientation == "horizontal"
 
 
-def test_measure_three_point_vertical_orientation() -> None:
+def test_measure_three_point_vertical_orientation(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test three-point measurement with vertical orientation."""
-    waveforms = {
-        1: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        2: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
-
-    metrics = measure_three_point(waveforms, orientation="vertical")
+    metrics = measure_three_point(staggered_waveforms, orientation="vertical")
 
     assert metrics.orientation == "vertical"
 
 
-def test_three_point_metrics_timing_uniformity_perfect() -> None:
+def test_three_point_metrics_timing_uniformity_perfect(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test timing uniformity when all pulses are identical."""
-    waveforms = {
-        1: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        2: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
-
-    metrics = measure_three_point(waveforms)
+    metrics = measure_three_point(staggered_waveforms)
 
     # All pulses are 60µs, so uniformity should be 100%
     assert metrics.timing_uniformity == pytest.approx(100.0, rel=0.1)
@@ -288,27 +353,11 @@ def test_three_point_metrics_timing_uniformity_varied() -> None:
     assert metrics.timing_uniformity == pytest.approx(83.3, rel=1)
 
 
-def test_three_point_metrics_delay_properties() -> None:
+def test_three_point_metrics_delay_properties(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test delay property conversions."""
-    waveforms = {
-        1: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        2: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
-
-    metrics = measure_three_point(waveforms)
+    metrics = measure_three_point(staggered_waveforms)
 
     # Test ms conversions
     assert metrics.first_to_center_delay_ms == pytest.approx(0.01, rel=0.01)
@@ -316,26 +365,12 @@ def test_three_point_metrics_delay_properties() -> None:
     assert metrics.shutter_travel_time_ms == pytest.approx(0.02, rel=0.01)
 
 
-def test_measure_three_point_custom_channels() -> None:
+def test_measure_three_point_custom_channels(
+    staggered_waveforms: dict[int, WaveformData],
+) -> None:
     """Test three-point measurement with custom channel mapping."""
     # Use non-standard channel numbers
-    waveforms = {
-        2: WaveformData(
-            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        3: WaveformData(
-            voltages=[0.0] * 20 + [3.3] * 60 + [0.0] * 20,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-        4: WaveformData(
-            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
-            sample_rate=1e6,
-            start_time=0.0,
-        ),
-    }
+    waveforms = {ch + 1: wf for ch, wf in staggered_waveforms.items()}
 
     metrics = measure_three_point(
         waveforms, first_channel=2, center_channel=3, last_channel=4
@@ -345,6 +380,23 @@ def test_measure_three_point_custom_channels() -> None:
     assert metrics.shutter_travel_time_s == pytest.approx(20e-6, rel=0.01)
 
 
+def test_measure_three_point_long_captures() -> None:
+    """Test three-point measurement of captures long enough to run in parallel."""
+    waveforms = {}
+    for channel in (1, 2, 3):
+        voltages = np.zeros(200_000, dtype=np.float32)
+        rise = 50_000 + channel * 1000
+        voltages[rise : rise + 100_000] = 3.3
+        waveforms[channel] = WaveformData(
+            voltages=voltages, sample_rate=1e6, start_time=0.0
+        )
+
+    metrics = measure_three_point(waveforms)
+
+    assert metrics.center.pulse_width_s == pytest.approx(0.1, rel=0.01)
+    assert metrics.shutter_travel_time_s == pytest.approx(2e-3, rel=0.01)
+
+
 def test_measure_three_point_missing_channel() -> None:
     """Test that missing channel raises KeyError."""
     waveforms = {
@@ -363,3 +415,23 @@ def test_measure_three_point_missing_channel() -> None:
 
     with pytest.raises(KeyError):
         measure_three_point(waveforms)
+
+
+def test_measure_three_point_channel_failure() -> None:
+    """Test that a pulse error on any channel propagates."""
+    waveforms = {
+        1: WaveformData(
+            voltages=[0.0] * 10 + [3.3] * 60 + [0.0] * 30,
+            sample_rate=1e6,
+            start_time=0.0,
+        ),
+        2: WaveformData(voltages=[0.0] * 100, sample_rate=1e6, start_time=0.0),
+        3: WaveformData(
+            voltages=[0.0] * 30 + [3.3] * 60 + [0.0] * 10,
+            sample_rate=1e6,
+            start_time=0.0,
+        ),
+    }
+
+    with pytest.raises(PulseMeasurementError):
+        measure_three_point(waveforms)
@@ -0,0 +1,63 @@
+"""Tests for the CLI capture pipeline."""
+
+import argparse
+import json
+import queue
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from shutterscope.__main__ import _Capture, _process_captures
+from shutterscope.oscilloscope import WaveformData
+
+
+def _pulse_capture(base: Path) -> _Capture:
+    """Build a single-point capture holding one 60µs pulse."""
+    voltages = np.zeros(100, dtype=np.float32)
+    voltages[20:80] = 3.3
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+    return base, {1: waveform}
+
+
+def _run_worker(captures: queue.Queue[_Capture | None]) -> None:
+    """Run _process_captures on a thread and check it stops at the sentinel."""
+    args = argparse.Namespace(three_point=False, format="json", plot=False)
+    worker = threading.Thread(target=_process_captures, args=(captures, args))
+    worker.start()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+
+
+def test_process_captures_stops_at_sentinel(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Verify captures before the None sentinel are saved and later ones left."""
+    captures: queue.Queue[_Capture | None] = queue.Queue()
+    captures.put(_pulse_capture(tmp_path / "first"))
+    captures.put(None)
+    captures.put(_pulse_capture(tmp_path / "after_sentinel"))
+
+    _run_worker(captures)
+
+    data = json.loads((tmp_path / "first.json").read_text())
+    assert data["shutter_speed_s"] == pytest.approx(60e-6, rel=0.01)
+    assert not (tmp_path / "after_sentinel.json").exists()
+    assert captures.qsize() == 1
+    assert "Results for first:" in capsys.readouterr().out
+
+
+def test_process_captures_continues_after_failure(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Verify a capture that fails to save does not stop later captures."""
+    captures: queue.Queue[_Capture | None] = queue.Queue()
+    captures.put(_pulse_capture(tmp_path / "missing_dir" / "failed"))
+    captures.put(_pulse_capture(tmp_path / "second"))
+    captures.put(None)
+
+    _run_worker(captures)
+
+    assert "Could not process capture failed" in capsys.readouterr().out
+    assert (tmp_path / "second.json").exists()
@@ -2,11 +2,18 @@
 
 from typing import Protocol, runtime_checkable
 
+import numpy as np
+
 from shutterscope.oscilloscope import OscilloscopeProtocol, WaveformData
 
 from .conftest import MockOscilloscope
 
 
+@runtime_checkable
+class RuntimeOscilloscopeProtocol(OscilloscopeProtocol, Protocol):
+    """OscilloscopeProtocol made runtime checkable for isinstance tests."""
+
+
 def test_waveform_data_dataclass() -> None:
     """Verify WaveformData stores voltages, sample_rate, start_time correctly."""
     voltages = [1.0, 2.0, 3.0]
@@ -17,28 +24,14 @@ def test_waveform_data_dataclass() -> None:
         voltages=voltages, sample_rate=sample_rate, start_time=start_time
     )
 
-    assert waveform.voltages == voltages
+    assert np.array_equal(waveform.voltages, voltages)
+    assert waveform.voltages.dtype == np.float32
     assert waveform.sample_rate == sample_rate
     assert waveform.start_time == start_time
 
 
 def test_mock_oscilloscope_implements_protocol() -> None:
     """Verify MockOscilloscope satisfies OscilloscopeProtocol."""
-
-    # Make OscilloscopeProtocol runtime checkable for this test
-    @runtime_checkable
-    class RuntimeOscilloscopeProtocol(Protocol):
-        def connect(self) -> None: ...
-        def disconnect(self) -> None: ...
-        def configure_timebase(
-            self, max_duration: float, sample_interval: float = 1e-6
-        ) -> None: ...
-        def setup_edge_trigger(
-            self, channel: int, level: float, slope: str = "NEG"
-        ) -> None: ...
-        def wait_for_trigger(self) -> None: ...
-        def get_waveform(self, channel: int) -> WaveformData: ...
-
     mock = MockOscilloscope()
     assert isinstance(mock, RuntimeOscilloscopeProtocol)
 
@@ -66,7 +59,7 @@ def test_mock_oscilloscope_custom_waveform() -> None:
 
     result = mock.get_waveform(channel=1)
 
-    assert result.voltages == [5.0, 0.0]
+    assert np.array_equal(result.voltages, [5.0, 0.0])
     assert result.sample_rate == 1000.0
     assert result.start_time == 0.0
 
@@ -132,6 +125,15 @@ def test_waveform_trim_preserves_sample_rate() -> None:
     assert trimmed.sample_rate == 2e6
 
 
+def test_waveform_trim_is_view() -> None:
+    """Test that trim shares sample memory instead of copying."""
+    waveform = WaveformData(voltages=list(range(100)), sample_rate=1e6, start_time=0.0)
+
+    trimmed = waveform.trim(10e-6, 40e-6)
+
+    assert np.shares_memory(trimmed.voltages, waveform.voltages)
+
+
 def test_mock_oscilloscope_get_waveforms() -> None:
     """Verify mock returns valid multi-channel waveform data."""
     mock = MockOscilloscope()
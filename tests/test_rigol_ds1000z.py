@@ -2,32 +2,69 @@
 
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
-from shutterscope.rigol_ds1000z import RigolDS1000Z
+from shutterscope.rigol_ds1000z import (
+    TRIGGER_POLL_INTERVAL_S,
+    VISA_CHUNK_SIZE,
+    VISA_TIMEOUT_MS,
+    RigolDS1000Z,
+)
 
 
 class MockVisaInstrument:
-    """Mock VISA instrument that records commands and returns configured responses."""
+    """Mock VISA instrument that records commands and returns configured responses.
+
+    Compound messages are split on ";" so that each command is recorded (and
+    each query answered) individually, as the oscilloscope would.
+    """
 
     def __init__(self) -> None:
         self.commands: list[tuple[str, str]] = []
+        # Messages as sent over the bus, before compound messages are split
+        self.messages: list[tuple[str, str]] = []
         self.query_responses: dict[str, str] = {}
         self.binary_data: list[int] = []
+        # If set, successive binary reads return these in turn instead
+        self.binary_chunks: list[list[int]] | None = None
+        # Container requested by each binary read
+        self.binary_containers: list[Any] = []
         self.closed = False
+        self.chunk_size = 20 * 1024
+        self.timeout = 2000
 
     def write(self, command: str) -> None:
-        self.commands.append(("write", command))
+        self.messages.append(("write", command))
+        for part in command.split(";"):
+            self.commands.append(("write", part))
 
     def query(self, command: str) -> str:
-        self.commands.append(("query", command))
-        return self.query_responses.get(command, "")
+        self.messages.append(("query", command))
+        responses = []
+        for part in command.split(";"):
+            self.commands.append(("query", part))
+            responses.append(self.query_responses.get(part, ""))
+        return ";".join(responses)
 
     def query_binary_values(
         self, command: str, datatype: str = "B", container: Any = list
-    ) -> list[int]:
-        self.commands.append(("query_binary_values", command))
-        return self.binary_data
+    ) -> npt.NDArray[np.uint8] | list[int]:
+        self.messages.append(("query_binary_values", command))
+        *writes, query = command.split(";")
+        for part in writes:
+            self.commands.append(("write", part))
+        self.commands.append(("query_binary_values", query))
+        self.binary_containers.append(container)
+        if self.binary_chunks is not None:
+            values = self.binary_chunks.pop(0)
+        else:
+            values = self.binary_data
+        # Unsigned bytes come back in the requested container, as from pyvisa
+        if container is np.ndarray:
+            return np.asarray(values, dtype=np.uint8)
+        return list(values)
 
     def close(self) -> None:
         self.closed = True
@@ -64,6 +101,14 @@ def test_setup_edge_trigger_raises_when_not_connected() -> None:
         scope.setup_edge_trigger(channel=1, level=0.5)
 
 
+def test_arm_raises_when_not_connected() -> None:
+    """Verify arm raises RuntimeError when not connected."""
+    scope = RigolDS1000Z("TEST::RESOURCE")
+
+    with pytest.raises(RuntimeError, match="Not connected"):
+        scope.arm()
+
+
 def test_wait_for_trigger_raises_when_not_connected() -> None:
     """Verify wait_for_trigger raises RuntimeError when not connected."""
     scope = RigolDS1000Z("TEST::RESOURCE")
@@ -99,6 +144,43 @@ def test_disconnect_when_not_connected() -> None:
     scope.disconnect()  # Should not raise
 
 
+def test_connect_reuses_resource_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the VISA resource manager is created once and shared."""
+    created = 0
+
+    class FakeResourceManager:
+        def __init__(self) -> None:
+            nonlocal created
+            created += 1
+
+        def open_resource(self, resource: str) -> MockVisaInstrument:
+            return MockVisaInstrument()
+
+    monkeypatch.setattr("pyvisa.ResourceManager", FakeResourceManager)
+    monkeypatch.setattr(RigolDS1000Z, "_resource_manager", None)
+
+    RigolDS1000Z("TEST::ONE").connect()
+    RigolDS1000Z("TEST::TWO").connect()
+
+    assert created == 1
+
+
+def test_connect_configures_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify connect sets a large read size and timeout for downloads."""
+    instrument = MockVisaInstrument()
+
+    class FakeResourceManager:
+        def open_resource(self, resource: str) -> MockVisaInstrument:
+            return instrument
+
+    monkeypatch.setattr(RigolDS1000Z, "_resource_manager", FakeResourceManager())
+
+    RigolDS1000Z("TEST::RESOURCE").connect()
+
+    assert instrument.chunk_size == VISA_CHUNK_SIZE
+    assert instrument.timeout == VISA_TIMEOUT_MS
+
+
 # configure_timebase tests
 
 
@@ -120,6 +202,8 @@ def test_configure_timebase_sends_all_commands(
     assert ":CHAN1:SCALe 0.5" in write_commands
     assert ":CHAN1:OFFSet -1.5" in write_commands
     assert ":CHAN1:DISPlay ON" in write_commands
+    # Everything is sent in a single message
+    assert len(mock_instrument.messages) == 1
 
 
 def test_configure_timebase_configures_multiple_channels(
@@ -140,6 +224,20 @@ def test_configure_timebase_memory_depth_selection() -> None:
     assert RigolDS1000Z.MEMORY_DEPTHS == [1000, 10000, 100000, 1000000, 6000000, 12000000]
 
 
+def test_configure_timebase_picks_closest_memory_depth(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify the memory depth closest to the required depth is chosen."""
+    # (max_duration, expected depth): required depth is 1.2 * max_duration / 1µs
+    cases = [(1e-3, 1000), (0.5, 1000000), (1.0, 1000000), (4.0, 6000000)]
+    for max_duration, expected_depth in cases:
+        mock_instrument.commands.clear()
+        scope_with_mock.configure_timebase(max_duration=max_duration)
+
+        write_commands = [cmd for op, cmd in mock_instrument.commands if op == "write"]
+        assert f":ACQuire:MDEPth {expected_depth}" in write_commands
+
+
 # setup_edge_trigger tests
 
 
@@ -156,6 +254,7 @@ def test_setup_edge_trigger_sends_all_commands(
     assert ":TRIGger:EDGe:SLOPe NEGative" in write_commands
     assert ":TRIGger:SWEep SINGle" in write_commands
     assert ":SINGle" in write_commands
+    assert len(mock_instrument.messages) == 1
 
     # Test with different channel, level, and positive slope
     mock_instrument.commands.clear()
@@ -167,6 +266,15 @@ def test_setup_edge_trigger_sends_all_commands(
     assert ":TRIGger:EDGe:SLOPe POSitive" in write_commands
 
 
+def test_arm_sends_single_write(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify arm re-arms with a single write and no queries."""
+    scope_with_mock.arm()
+
+    assert mock_instrument.commands == [("write", ":SINGle")]
+
+
 # wait_for_trigger tests
 
 
@@ -183,6 +291,28 @@ def test_wait_for_trigger_returns_on_completion_status(
     scope_with_mock.wait_for_trigger()  # Should also return immediately
 
 
+def test_wait_for_trigger_polls_until_triggered(
+    scope_with_mock: RigolDS1000Z,
+    mock_instrument: MockVisaInstrument,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify wait_for_trigger polls the status at the poll interval."""
+    mock_instrument.query_responses[":TRIGger:STATus?"] = "WAIT"
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            mock_instrument.query_responses[":TRIGger:STATus?"] = "TD"
+
+    monkeypatch.setattr("shutterscope.rigol_ds1000z.time.sleep", sleep)
+
+    scope_with_mock.wait_for_trigger()
+
+    assert sleeps == [TRIGGER_POLL_INTERVAL_S] * 3
+    assert mock_instrument.commands == [("query", ":TRIGger:STATus?")] * 4
+
+
 # get_waveform tests
 
 
@@ -206,6 +336,22 @@ def test_get_waveform_configures_source_and_mode(
     assert waveform.sample_rate == 500000
 
 
+def test_get_waveform_reads_bytes_into_ndarray(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify sample bytes are read as a uint8 array, not a list of ints."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "1000"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "1.0"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "500000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0"
+    mock_instrument.binary_data = [128] * 1000
+
+    scope_with_mock.get_waveform(channel=1)
+
+    assert mock_instrument.binary_containers == [np.ndarray]
+
+
 def test_get_waveform_voltage_conversion(
     scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
 ) -> None:
@@ -269,6 +415,106 @@ def test_get_waveform_timing_calculation(
     assert waveform.sample_rate == 1000000
 
 
+def test_get_waveform_concatenates_chunks(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify large captures are downloaded in chunks into one float32 array."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "500000"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "0.5"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_data = [128] * 250000
+
+    waveform = scope_with_mock.get_waveform(channel=1)
+
+    write_commands = [cmd for op, cmd in mock_instrument.commands if op == "write"]
+    assert ":WAVeform:STARt 250001" in write_commands
+    assert ":WAVeform:STOP 500000" in write_commands
+    assert len(waveform.voltages) == 500000
+    assert waveform.voltages.dtype == np.float32
+
+
+def test_get_waveform_batches_setting_queries(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify settings are read in one round trip and each chunk in another."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "500000"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "0.5"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_data = [128] * 250000
+
+    scope_with_mock.get_waveform(channel=1)
+
+    ops = [op for op, _ in mock_instrument.messages]
+    assert ops.count("query") == 1
+    assert ops.count("query_binary_values") == 2
+    # :STOP and waveform setup; chunk ranges travel with the data queries
+    assert ops.count("write") == 2
+
+
+def test_get_waveform_auto_memory_depth(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify AUTO memory depth is derived from sample rate and timebase."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "AUTO"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "0.5"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:SCALe?"] = "0.0001"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_data = [128] * 1200
+
+    waveform = scope_with_mock.get_waveform(channel=1)
+
+    write_commands = [cmd for op, cmd in mock_instrument.commands if op == "write"]
+    assert ":WAVeform:STOP 1200" in write_commands
+    assert len(waveform.voltages) == 1200
+
+
+def test_get_waveform_places_chunks_in_order(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify each chunk lands at its offset, including a short final chunk."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "300000"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "3.2"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_chunks = [[138] * 250000, [148] * 50000]
+
+    waveform = scope_with_mock.get_waveform(channel=1)
+
+    write_commands = [cmd for op, cmd in mock_instrument.commands if op == "write"]
+    assert ":WAVeform:STOP 300000" in write_commands
+    assert len(waveform.voltages) == 300000
+    assert waveform.voltages[249999] == pytest.approx(1.0)
+    assert waveform.voltages[250000] == pytest.approx(2.0)
+
+
+def test_get_waveform_reuses_staging_buffer(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify repeated downloads reuse one raw buffer but return independent data."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "3"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "3.2"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_data = [128, 138, 148]
+
+    first = scope_with_mock.get_waveform(channel=1)
+    buffer = scope_with_mock._raw_buffer
+    mock_instrument.binary_data = [128, 118, 108]
+    second = scope_with_mock.get_waveform(channel=1)
+
+    assert scope_with_mock._raw_buffer is buffer
+    assert first.voltages.tolist() == pytest.approx([0.0, 1.0, 2.0])
+    assert second.voltages.tolist() == pytest.approx([0.0, -1.0, -2.0])
+
+
 # get_waveforms tests
 
 
@@ -293,3 +539,38 @@ def test_get_waveforms_returns_all_channels(
     assert 1 in waveforms
     assert 2 in waveforms
     assert 3 in waveforms
+
+
+def test_get_waveforms_stops_and_queries_once(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify all channels share one stop and one settings round trip."""
+    mock_instrument.query_responses[":ACQuire:MDEPth?"] = "3"
+    mock_instrument.query_responses[":CHAN1:SCALe?"] = "3.2"
+    mock_instrument.query_responses[":CHAN1:OFFSet?"] = "0.0"
+    mock_instrument.query_responses[":CHAN2:SCALe?"] = "6.4"
+    mock_instrument.query_responses[":CHAN2:OFFSet?"] = "1.0"
+    mock_instrument.query_responses[":ACQuire:SRATe?"] = "1000000"
+    mock_instrument.query_responses[":TIMebase:MAIN:OFFSet?"] = "0.0"
+    mock_instrument.binary_data = [128, 138, 148]
+
+    waveforms = scope_with_mock.get_waveforms([1, 2])
+
+    assert mock_instrument.commands.count(("write", ":STOP")) == 1
+    assert [op for op, _ in mock_instrument.messages].count("query") == 1
+    assert waveforms[1].voltages.tolist() == pytest.approx([0.0, 1.0, 2.0])
+    assert waveforms[2].voltages.tolist() == pytest.approx([-1.0, 1.0, 3.0])
+
+
+def test_get_waveforms_rejects_short_settings_reply(
+    scope_with_mock: RigolDS1000Z, mock_instrument: MockVisaInstrument
+) -> None:
+    """Verify a truncated settings reply raises an error naming the query."""
+
+    def query(command: str) -> str:
+        return "1000;1000000"
+
+    mock_instrument.query = query  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match=r"Expected 6 replies to ':ACQuire:MDEPth\?"):
+        scope_with_mock.get_waveforms([1])
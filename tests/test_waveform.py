@@ -1,13 +1,24 @@
 """Tests for waveform data handling."""
 
 import json
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from shutterscope.oscilloscope import WaveformData
 from shutterscope.waveform import (
+    _PLOT_DECIMATE_FACTOR,
+    _plot_axes,
+    _plot_points,
     load_waveform_json,
+    save_three_point_json,
+    save_three_point_npy,
     save_waveform_csv,
     save_waveform_json,
+    save_waveform_npy,
 )
 
 
@@ -44,11 +55,86 @@ def test_load_waveform_json(tmp_path: Path) -> None:
     save_waveform_json(waveform, str(output_file))
     loaded = load_waveform_json(str(output_file))
 
-    assert loaded.voltages == waveform.voltages
+    assert np.array_equal(loaded.voltages, waveform.voltages)
     assert loaded.sample_rate == waveform.sample_rate
     assert loaded.start_time == waveform.start_time
 
 
+@pytest.mark.parametrize("save", [save_three_point_json, save_three_point_npy])
+def test_load_waveform_json_rejects_three_point(
+    tmp_path: Path,
+    save: Callable[[dict[int, WaveformData], str], None],
+) -> None:
+    """Verify loading a three-point file raises a clear error."""
+    waveforms = {
+        ch: WaveformData(voltages=[0.0, 3.3], sample_rate=1e6, start_time=0.0)
+        for ch in (1, 2, 3)
+    }
+    output_file = tmp_path / "test.json"
+    save(waveforms, str(output_file))
+
+    with pytest.raises(ValueError, match="three-point capture"):
+        load_waveform_json(str(output_file))
+
+
+def test_save_waveform_npy_round_trip(tmp_path: Path) -> None:
+    """Verify .npy samples and JSON sidecar can be loaded back."""
+    waveform = WaveformData(
+        voltages=[0.0, 3.3, 0.0],
+        sample_rate=1e6,
+        start_time=-0.001,
+    )
+    output_file = tmp_path / "test.json"
+
+    save_waveform_npy(waveform, str(output_file))
+
+    sidecar = json.loads(output_file.read_text())
+    assert sidecar["samples_file"] == "test.npy"
+    assert "samples" not in sidecar
+    assert (tmp_path / "test.npy").exists()
+
+    loaded = load_waveform_json(str(output_file))
+
+    assert np.array_equal(loaded.voltages, waveform.voltages)
+    assert loaded.sample_rate == waveform.sample_rate
+    assert loaded.start_time == waveform.start_time
+
+
+def test_save_three_point_json(tmp_path: Path) -> None:
+    """Verify three-point samples are written rounded per channel."""
+    waveforms = {
+        ch: WaveformData(
+            voltages=[0.0, ch + 0.1234567], sample_rate=1e6, start_time=0.0
+        )
+        for ch in (1, 2, 3)
+    }
+    output_file = tmp_path / "test.json"
+
+    save_three_point_json(waveforms, str(output_file))
+
+    data = json.loads(output_file.read_text())
+    assert data["mode"] == "three_point"
+    assert data["channels"]["1"]["label"] == "first"
+    assert data["channels"]["3"]["samples"] == [0.0, 3.123457]
+
+
+def test_save_three_point_npy(tmp_path: Path) -> None:
+    """Verify three-point samples are stored per channel in an .npz file."""
+    waveforms = {
+        ch: WaveformData(voltages=[0.0, float(ch)], sample_rate=1e6, start_time=0.0)
+        for ch in (1, 2, 3)
+    }
+    output_file = tmp_path / "test.json"
+
+    save_three_point_npy(waveforms, str(output_file))
+
+    sidecar = json.loads(output_file.read_text())
+    assert sidecar["samples_file"] == "test.npz"
+    assert sidecar["channels"]["2"]["label"] == "center"
+    with np.load(tmp_path / "test.npz") as samples:
+        assert np.array_equal(samples["3"], [0.0, 3.0])
+
+
 def test_save_waveform_csv(tmp_path: Path) -> None:
     """Verify CSV file is created with correct header and data."""
     waveform = WaveformData(
@@ -70,6 +156,70 @@ def test_save_waveform_csv(tmp_path: Path) -> None:
     assert lines[3] == "2e-06,0"
 
 
+def test_save_waveform_csv_spans_blocks(tmp_path: Path) -> None:
+    """Verify every row is written when the capture spans several blocks."""
+    waveform = WaveformData(
+        voltages=np.full(150_000, 1.5), sample_rate=1e6, start_time=0.0
+    )
+    output_file = tmp_path / "test.csv"
+
+    save_waveform_csv(waveform, str(output_file))
+
+    lines = output_file.read_text().strip().split("\n")
+    assert len(lines) == 150_001
+    assert lines[-1] == "0.149999,1.5"
+
+
+def test_plot_axes_reused_per_thread() -> None:
+    """Verify figures are reused within a thread but not shared between threads."""
+    fig, ax = _plot_axes((4, 3))
+    ax.plot([0, 1], [0, 1])
+    other_threads: list[object] = []
+    worker = threading.Thread(
+        target=lambda: other_threads.append(_plot_axes((4, 3))[0])
+    )
+    worker.start()
+    worker.join()
+
+    reused_fig, reused_ax = _plot_axes((4, 3))
+
+    assert reused_fig is fig
+    assert not reused_ax.lines
+    assert other_threads[0] is not fig
+
+
+def test_plot_points_short_capture_unchanged() -> None:
+    """Verify captures up to the decimation limit are plotted sample by sample."""
+    voltages = np.linspace(0.0, 3.3, _PLOT_DECIMATE_FACTOR * 10)
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=-1e-5)
+
+    times_ms, plotted = _plot_points(waveform, width_px=10)
+
+    assert plotted is waveform.voltages
+    assert np.allclose(times_ms, waveform.get_times() * 1000)
+    assert times_ms[0] == -0.01
+
+
+def test_plot_points_long_capture_keeps_min_and_max() -> None:
+    """Verify long captures reduce to per-pixel min/max, keeping narrow spikes."""
+    voltages = np.full(1000, 0.1, dtype=np.float32)
+    voltages[437] = 5.0
+    voltages[12] = -1.0
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    times_ms, plotted = _plot_points(waveform, width_px=10)
+
+    assert len(times_ms) == len(plotted) == 20
+    # Minimum in even slots, maximum in odd slots, for each 100-sample bin
+    assert plotted[0] == -1.0
+    assert plotted[9] == 5.0
+    assert plotted.max() == 5.0
+    assert np.all(plotted[2::2] == np.float32(0.1))
+    # Both points of a bin are placed at the bin's start time
+    assert times_ms[8] == times_ms[9] == 0.4
+    assert np.allclose(times_ms[0::2], np.arange(10) * 0.1)
+
+
 def test_waveform_get_times() -> None:
     """Verify time reconstruction from sample_rate and start_time."""
     waveform = WaveformData(
@@ -80,7 +230,32 @@ def test_waveform_get_times() -> None:
 
     times = waveform.get_times()
 
+    assert isinstance(times, np.ndarray)
     assert len(times) == 3
     assert times[0] == -1e-6
     assert times[1] == 0.0
     assert times[2] == 1e-6
+
+
+def test_waveform_voltage_range() -> None:
+    """Verify voltage_range reports the minimum and maximum sample."""
+    waveform = WaveformData(voltages=[0.5, -1.0, 2.0], sample_rate=1e6, start_time=0.0)
+
+    assert waveform.voltage_range == (-1.0, 2.0)
+
+
+def test_waveform_voltage_range_spans_blocks() -> None:
+    """Verify voltage_range finds extremes beyond the first reduction block."""
+    voltages = np.zeros(1_000_000, dtype=np.float32)
+    voltages[600_000] = -2.5
+    voltages[-1] = 4.0
+    waveform = WaveformData(voltages=voltages, sample_rate=1e6, start_time=0.0)
+
+    assert waveform.voltage_range == (-2.5, 4.0)
+
+
+def test_waveform_dt() -> None:
+    """Verify dt is the reciprocal of the sample rate."""
+    waveform = WaveformData(voltages=[0.0, 1.0], sample_rate=2e6, start_time=0.0)
+
+    assert waveform.dt == 5e-7